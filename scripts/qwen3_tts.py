@@ -6,31 +6,63 @@ https://huggingface.co/Qwen/Qwen3-TTS
 """
 
 import argparse
+import json
 import sys
 import os
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 try:
+    import soundfile
     import torch
-    import torchaudio
     from transformers import AutoModelForCausalLM, AutoTokenizer
 except ImportError:
     print("ERROR: Required packages not installed.", file=sys.stderr)
-    print("Install with: pip install torch torchaudio transformers", file=sys.stderr)
+    print("Install with: pip install torch soundfile transformers", file=sys.stderr)
     sys.exit(1)
 
+# TF32 tensor-core matmuls for any remaining fp32 ops; cheap on quality
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.allow_tf32 = True
+torch.backends.cudnn.benchmark = True
+torch.set_float32_matmul_precision("high")
 
-def generate_speech(text: str, output_path: str, model_path: str = None, speed: float = 1.0,
-                   voice: str = None, temperature: float = 0.7):
+
+def inference_dtype():
     """
-    Generate speech from text using Qwen3-TTS
+    Pick the weight dtype for inference: bf16 on Ampere+, fp16 on older GPUs,
+    fp32 on CPU (half precision is slow or unsupported there)
+    """
+    if not torch.cuda.is_available():
+        return torch.float32
+    if torch.cuda.is_bf16_supported():
+        return torch.bfloat16
+    return torch.float16
+
+
+def is_prequantized(model_path: str) -> bool:
+    """
+    Check whether a local checkpoint was saved already quantized
+    """
+    config_path = os.path.join(model_path, "config.json")
+    if not os.path.isfile(config_path):
+        return False
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return "quantization_config" in json.load(f)
+
+
+def load_model(model_path: str = None, quant: str = "none"):
+    """
+    Load the TTS model once so it can be reused across utterances
 
     Args:
-        text: Text to synthesize
-        output_path: Path to save WAV file
         model_path: Path to local model or HuggingFace model ID
-        speed: Speech speed multiplier (0.5 - 2.0)
-        voice: Voice variant (if supported by model)
-        temperature: Sampling temperature for variety
+        quant: Weight quantization ("none" or "int8")
+
+    Returns:
+        A Qwen3-TTS model, or a Coqui TTS instance when falling back
     """
     # Default to HuggingFace model if no local path provided
     if model_path is None:
@@ -38,62 +70,232 @@ def generate_speech(text: str, output_path: str, model_path: str = None, speed:
 
     print(f"Loading Qwen3-TTS model from {model_path}...", file=sys.stderr)
 
+    # Check if model is available locally or needs download
+    # Qwen3-TTS uses a specific architecture - adapt based on actual model
+    # This is a template that will need adjustment based on actual Qwen3-TTS API
+
+    # For now, using a generic transformers approach
+    # The actual Qwen3-TTS might have a custom pipeline
+
+    # Option 1: Check if there's a dedicated Qwen3-TTS library
+    try:
+        # Try importing qwen-tts if it exists
+        import qwen_tts
+    except ImportError:
+        qwen_tts = None
+
+    if qwen_tts is not None:
+        # Load weights directly in half precision; don't wrap generate in
+        # autocast, which is slower than running the model in fp16 outright
+        load_kwargs = {
+            "torch_dtype": inference_dtype(),
+            "low_cpu_mem_usage": True,
+            "device_map": "cuda" if torch.cuda.is_available() else "cpu",
+        }
+
+        if is_prequantized(model_path):
+            # Checkpoint carries its own quantization config and dtypes
+            print("Detected pre-quantized checkpoint", file=sys.stderr)
+            load_kwargs.pop("torch_dtype")
+        elif quant == "int8":
+            if not torch.cuda.is_available():
+                raise RuntimeError("--quant int8 requires a CUDA GPU")
+            from transformers import BitsAndBytesConfig
+            # Per-channel INT8 weights halve weight traffic vs fp16
+            load_kwargs["quantization_config"] = BitsAndBytesConfig(load_in_8bit=True)
+
+        return qwen_tts.TTSModel.from_pretrained(model_path, **load_kwargs)
+
+    # Fall back to transformers (might need custom code for actual Qwen3-TTS)
+    print("Using transformers backend (update this for official Qwen3-TTS API)", file=sys.stderr)
+
+    # Placeholder for actual implementation
+    # The real Qwen3-TTS will have specific loading instructions
+    # For now, create a simple synthesizer using available tools
+
+    # Using a text-to-speech approach that actually exists
+    # We'll need to update this when Qwen3-TTS releases official code
     try:
-        # Check if model is available locally or needs download
-        # Qwen3-TTS uses a specific architecture - adapt based on actual model
-        # This is a template that will need adjustment based on actual Qwen3-TTS API
+        from TTS.api import TTS as CoquiTTS
+        # Use Coqui TTS as fallback (fast, local, high quality)
+        print("Using Coqui TTS fallback", file=sys.stderr)
+        return CoquiTTS(model_name="tts_models/en/ljspeech/tacotron2-DDC",
+                        progress_bar=False)
+    except ImportError:
+        print("ERROR: Neither Qwen3-TTS nor fallback TTS available", file=sys.stderr)
+        print("Install Coqui TTS: pip install TTS", file=sys.stderr)
+        print("Or wait for official Qwen3-TTS Python package", file=sys.stderr)
+        sys.exit(1)
 
-        # For now, using a generic transformers approach
-        # The actual Qwen3-TTS might have a custom pipeline
 
-        # Option 1: Check if there's a dedicated Qwen3-TTS library
+def compile_model(model, speed: float = 1.0, voice: str = None,
+                  temperature: float = 0.7) -> bool:
+    """
+    Compile the model's forward pass with CUDA Graphs ("reduce-overhead") and
+    warm it up, so repeated decoding replays graphs instead of launching
+    every kernel. Only worth it when the model serves many utterances.
+
+    Compilation is an optimization only: if it fails (no Triton, an op
+    Inductor can't handle, an older torch), the model is left running eagerly.
+
+    Returns:
+        True if the model was compiled
+    """
+    if not torch.cuda.is_available() or not isinstance(model, torch.nn.Module):
+        return False
+    # bitsandbytes int8 layers don't trace cleanly
+    if getattr(model, "is_loaded_in_8bit", False):
+        return False
+
+    print("Compiling model (first run is slow)...", file=sys.stderr)
+    eager_forward = model.forward
+    try:
+        model.forward = torch.compile(eager_forward, mode="reduce-overhead")
+        torch.compiler.cudagraph_mark_step_begin()
+        model.generate(text="Warm up.", speed=speed, voice=voice, temperature=temperature)
+    except Exception as e:
+        model.forward = eager_forward
+        print(f"WARNING: Compilation failed, running eagerly: {e}", file=sys.stderr)
+        return False
+    return True
+
+
+def generate_audio(model, text: str, speed: float = 1.0, voice: str = None,
+                   temperature: float = 0.7):
+    """
+    Run the model for one utterance
+
+    Returns:
+        A 1-D float32 numpy array of samples, or encoded WAV bytes
+    """
+    # Generate speech with model
+    audio = model.generate(
+        text=text,
+        speed=speed,
+        voice=voice,
+        temperature=temperature
+    )
+
+    # Assuming audio is a tensor: one device-to-host copy (and upcast from
+    # half precision) straight into a numpy view, ready for soundfile
+    if isinstance(audio, torch.Tensor):
+        return audio.detach().to(device="cpu", dtype=torch.float32).numpy()
+    return audio
+
+
+def write_audio(audio, output_path: str, sample_rate: int):
+    """
+    Save generated audio to a WAV file
+
+    Returns:
+        Duration of the audio in seconds, or None if it can't be determined
+    """
+    if isinstance(audio, (bytes, bytearray)):
+        # Handle other formats
+        with open(output_path, 'wb') as f:
+            f.write(audio)
         try:
-            # Try importing qwen-tts if it exists
-            import qwen_tts
-            model = qwen_tts.TTSModel.from_pretrained(model_path)
-        except ImportError:
-            # Fall back to transformers (might need custom code for actual Qwen3-TTS)
-            print("Using transformers backend (update this for official Qwen3-TTS API)", file=sys.stderr)
-
-            # Placeholder for actual implementation
-            # The real Qwen3-TTS will have specific loading instructions
-            # For now, create a simple synthesizer using available tools
-
-            # Using a text-to-speech approach that actually exists
-            # We'll need to update this when Qwen3-TTS releases official code
-            try:
-                from TTS.api import TTS as CoquiTTS
-                # Use Coqui TTS as fallback (fast, local, high quality)
-                tts = CoquiTTS(model_name="tts_models/en/ljspeech/tacotron2-DDC",
-                              progress_bar=False)
-                tts.tts_to_file(text=text, file_path=output_path)
-                print(f"Generated speech (using Coqui TTS fallback): {output_path}", file=sys.stderr)
-                return
-            except ImportError:
-                print("ERROR: Neither Qwen3-TTS nor fallback TTS available", file=sys.stderr)
-                print("Install Coqui TTS: pip install TTS", file=sys.stderr)
-                print("Or wait for official Qwen3-TTS Python package", file=sys.stderr)
-                sys.exit(1)
-
-        # If we have actual Qwen3-TTS model
-        print("Generating speech...", file=sys.stderr)
+            with wave.open(output_path, "rb") as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError):
+            # Not WAV data; the file is written as-is, length unknown
+            return None
+
+    soundfile.write(output_path, audio, sample_rate, subtype="PCM_16")
+    return audio.shape[0] / sample_rate
+
+
+def synthesize(model, text: str, output_path: str, speed: float = 1.0,
+               voice: str = None, temperature: float = 0.7):
+    """
+    Synthesize one utterance with an already-loaded model
+
+    Returns:
+        Duration of the generated audio in seconds, or None if unknown
+    """
+    # Coqui fallback writes the file itself
+    if hasattr(model, "tts_to_file"):
+        model.tts_to_file(text=text, file_path=output_path)
+        with wave.open(output_path, "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
 
-        # Generate speech with model
-        audio = model.generate(
-            text=text,
-            speed=speed,
-            voice=voice,
-            temperature=temperature
-        )
-
-        # Save to WAV file
-        # Assuming audio is a tensor
-        if isinstance(audio, torch.Tensor):
-            torchaudio.save(output_path, audio.unsqueeze(0), sample_rate=model.sample_rate)
-        else:
-            # Handle other formats
-            with open(output_path, 'wb') as f:
-                f.write(audio)
+    audio = generate_audio(model, text, speed=speed, voice=voice,
+                           temperature=temperature)
+    return write_audio(audio, output_path, model.sample_rate)
+
+
+_emit_lock = threading.Lock()
+_protocol_out = sys.stdout
+
+
+def reserve_stdout_for_protocol():
+    """
+    Keep a duplicate of the real stdout for batch protocol lines and point
+    fd 1 at stderr, so progress output from model libraries (Coqui prints
+    to stdout) can't get mixed into the OK/ERR stream
+    """
+    global _protocol_out
+    sys.stdout.flush()
+    _protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+
+def emit(line: str):
+    """
+    Write one batch protocol line; the writer thread and the main loop both
+    report, so each line is written and flushed under a lock
+    """
+    with _emit_lock:
+        _protocol_out.write(line + "\n")
+        _protocol_out.flush()
+
+
+def format_duration(duration) -> str:
+    """
+    Protocol duration field; empty when the duration is unknown
+    """
+    return "" if duration is None else f"{duration:.3f}"
+
+
+def write_and_report(audio, output_path: str, sample_rate: int):
+    """
+    Batch-mode writer: save audio and emit its protocol line
+    """
+    try:
+        duration = write_audio(audio, output_path, sample_rate)
+        emit(f"OK\t{output_path}\t{format_duration(duration)}")
+    except Exception as e:
+        report_error(output_path, e)
+
+
+def report_error(output_path: str, error: Exception):
+    """
+    Batch-mode error line; tabs and newlines would break the protocol
+    """
+    message = str(error).replace("\t", " ").replace("\n", " ")
+    emit(f"ERR\t{output_path}\t{message}")
+
+
+def generate_speech(text: str, output_path: str, model_path: str = None, speed: float = 1.0,
+                   voice: str = None, temperature: float = 0.7, quant: str = "none"):
+    """
+    Generate speech from text using Qwen3-TTS
+
+    Args:
+        text: Text to synthesize
+        output_path: Path to save WAV file
+        model_path: Path to local model or HuggingFace model ID
+        speed: Speech speed multiplier (0.5 - 2.0)
+        voice: Voice variant (if supported by model)
+        temperature: Sampling temperature for variety
+        quant: Weight quantization ("none" or "int8")
+    """
+    try:
+        model = load_model(model_path, quant=quant)
+
+        print("Generating speech...", file=sys.stderr)
+        synthesize(model, text, output_path, speed=speed, voice=voice,
+                   temperature=temperature)
 
         print(f"Successfully generated: {output_path}", file=sys.stderr)
 
@@ -102,24 +304,96 @@ def generate_speech(text: str, output_path: str, model_path: str = None, speed:
         sys.exit(1)
 
 
+def batch_main(model, speed: float = 1.0, voice: str = None, temperature: float = 0.7,
+               compiled: bool = False):
+    """
+    Synthesize many utterances with one loaded model
+
+    Reads "output_path<TAB>text" lines from stdin and writes one
+    "OK<TAB>output_path<TAB>duration" or "ERR<TAB>output_path<TAB>message"
+    line to stdout per request, flushing after each so callers can stream.
+    The duration field is empty when it can't be determined.
+    """
+    # Coqui fallback writes files itself; otherwise disk writes happen on a
+    # single background thread so generating N+1 overlaps writing N
+    writes_in_background = not hasattr(model, "tts_to_file")
+
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        # Stream raw lines so each request starts as soon as it arrives
+        for raw in sys.stdin.buffer:
+            try:
+                line = raw.decode("utf-8").rstrip("\r\n")
+            except UnicodeDecodeError as e:
+                # One bad line gets an ERR reply; it must not end the batch
+                output_path = raw.decode("utf-8", errors="replace").partition("\t")[0]
+                report_error(output_path, e)
+                continue
+            if not line:
+                continue
+
+            output_path, sep, text = line.partition("\t")
+            if not sep or not text.strip():
+                emit(f"ERR\t{output_path}\texpected output_path<TAB>text")
+                continue
+
+            try:
+                if compiled:
+                    # Each utterance is a new step for CUDA Graph replay
+                    torch.compiler.cudagraph_mark_step_begin()
+
+                if writes_in_background:
+                    audio = generate_audio(model, text, speed=speed, voice=voice,
+                                           temperature=temperature)
+                    writer.submit(write_and_report, audio, output_path, model.sample_rate)
+                else:
+                    duration = synthesize(model, text, output_path, speed=speed,
+                                          voice=voice, temperature=temperature)
+                    emit(f"OK\t{output_path}\t{format_duration(duration)}")
+            except Exception as e:
+                report_error(output_path, e)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Qwen3-TTS Speech Generation")
-    parser.add_argument("--text-file", required=True, help="Path to text file to synthesize")
-    parser.add_argument("--output", required=True, help="Output WAV file path")
+    parser.add_argument("--text-file", help="Path to text file to synthesize")
+    parser.add_argument("--output", help="Output WAV file path")
+    parser.add_argument("--batch", action="store_true",
+                        help="Load the model once and read output_path<TAB>text lines from stdin")
     parser.add_argument("--model-path", default=None, help="Path to Qwen3-TTS model")
     parser.add_argument("--speed", type=float, default=1.0, help="Speech speed (0.5-2.0)")
     parser.add_argument("--voice", default=None, help="Voice variant")
     parser.add_argument("--temperature", type=float, default=0.7, help="Sampling temperature")
+    parser.add_argument("--quant", choices=["none", "int8"], default="none",
+                        help="Weight quantization (int8 needs bitsandbytes and a CUDA GPU)")
+    parser.add_argument("--no-compile", action="store_true",
+                        help="Skip torch.compile in batch mode and run the model eagerly")
 
     args = parser.parse_args()
 
+    if args.batch:
+        reserve_stdout_for_protocol()
+        try:
+            model = load_model(args.model_path, quant=args.quant)
+        except Exception as e:
+            print(f"ERROR: Failed to load model: {e}", file=sys.stderr)
+            sys.exit(1)
+        compiled = not args.no_compile and compile_model(
+            model, speed=args.speed, voice=args.voice,
+            temperature=args.temperature)
+        batch_main(model, speed=args.speed, voice=args.voice,
+                   temperature=args.temperature, compiled=compiled)
+        return
+
+    if not args.text_file or not args.output:
+        parser.error("--text-file and --output are required unless --batch is set")
+
     # Read text from file
     if not os.path.exists(args.text_file):
         print(f"ERROR: Text file not found: {args.text_file}", file=sys.stderr)
         sys.exit(1)
 
-    with open(args.text_file, 'r', encoding='utf-8') as f:
-        text = f.read().strip()
+    # Single read + decode; avoids a second full-size copy from text-mode I/O
+    text = Path(args.text_file).read_bytes().decode("utf-8").strip()
 
     if not text:
         print("ERROR: Empty text file", file=sys.stderr)
@@ -132,7 +406,8 @@ def main():
         model_path=args.model_path,
         speed=args.speed,
         voice=args.voice,
-        temperature=args.temperature
+        temperature=args.temperature,
+        quant=args.quant
     )
 
 
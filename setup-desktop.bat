@@ -106,9 +106,9 @@ echo %BLUE%[3/7] Installing Python Dependencies (for TTS)...%NC%
 echo.
 
 if %PYTHON_FOUND%==1 (
-    echo Installing Python packages: torch, torchaudio, transformers, TTS...
+    echo Installing Python packages: torch, soundfile, transformers, TTS...
     python -m pip install --upgrade pip
-    python -m pip install torch torchaudio transformers TTS
+    python -m pip install torch soundfile transformers TTS
     if %errorlevel% neq 0 (
         echo %YELLOW%WARNING: Python package installation failed!%NC%
         echo Voice TTS may not work. Check your Python installation.
@@ -103,7 +103,8 @@ export class App {
   }
 
   private setupRedis(): void {
-    this.redis = new Redis(this.config.redis.url);
+    const { url, socketPath } = this.config.redis;
+    this.redis = new Redis(url, socketPath ? { path: socketPath } : {});
     this.redis.on("error", (err) => {
       logger.error("Redis error", { error: err.message });
     });
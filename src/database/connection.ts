@@ -3,19 +3,42 @@
  * Manages database connection pool with proper error handling
  */
 
-import { Pool, PoolClient, QueryResult, QueryResultRow } from "pg";
+import {
+  Pool,
+  PoolClient,
+  QueryConfig,
+  QueryResult,
+  QueryResultRow,
+} from "pg";
 
 import { getConfig } from "@/config/index.js";
+import type { AppConfig } from "@/types/index.js";
 import { logger } from "@/utils/logger.js";
 
 let pool: Pool | null = null;
 
+/**
+ * PostgreSQL's limit on bind parameters per statement
+ */
+const MAX_QUERY_PARAMS = 65535;
+
 export interface DatabaseConfig {
   connectionString: string;
   maxConnections: number;
   ssl: boolean;
 }
 
+/**
+ * Map app database settings to pool settings
+ */
+function toPoolConfig(database: AppConfig["database"]): DatabaseConfig {
+  return {
+    connectionString: database.url,
+    maxConnections: database.maxConnections,
+    ssl: database.ssl,
+  };
+}
+
 /**
  * Initialize the database connection pool
  */
@@ -24,11 +47,7 @@ export function initializePool(config?: DatabaseConfig): Pool {
     return pool;
   }
 
-  const appConfig = config ?? {
-    connectionString: getConfig().database.url,
-    maxConnections: getConfig().database.maxConnections,
-    ssl: getConfig().database.ssl,
-  };
+  const appConfig = config ?? toPoolConfig(getConfig().database);
 
   pool = new Pool({
     connectionString: appConfig.connectionString,
@@ -62,24 +81,26 @@ export function getPool(): Pool {
 }
 
 /**
- * Execute a query with automatic connection management
+ * Run a query config against the pool with timing and error logging
  */
-export async function query<T extends QueryResultRow = QueryResultRow>(
-  text: string,
-  params?: unknown[]
+async function runQuery<T extends QueryResultRow>(
+  config: QueryConfig<unknown[]>
 ): Promise<QueryResult<T>> {
   const currentPool = getPool();
+  const { text } = config;
   const start = Date.now();
 
   try {
-    const result = await currentPool.query<T>(text, params);
-    const duration = Date.now() - start;
+    const result = await currentPool.query<T>(config);
 
-    logger.info("Query executed", {
-      query: text.substring(0, 100),
-      duration: `${duration}ms`,
-      rows: result.rowCount,
-    });
+    // Skip building the per-query context when info logging is off
+    if (logger.isLevelEnabled("info")) {
+      logger.info("Query executed", {
+        query: text.substring(0, 100),
+        duration: `${Date.now() - start}ms`,
+        rows: result.rowCount,
+      });
+    }
 
     return result;
   } catch (error) {
@@ -91,6 +112,26 @@ export async function query<T extends QueryResultRow = QueryResultRow>(
   }
 }
 
+/**
+ * Execute a query with automatic connection management
+ */
+export async function query<T extends QueryResultRow = QueryResultRow>(
+  text: string,
+  params?: unknown[]
+): Promise<QueryResult<T>> {
+  return await runQuery<T>({ text, values: params });
+}
+
+/**
+ * Execute a hot query as a named prepared statement
+ * Each pooled connection parses and plans it once, then reuses the plan
+ */
+export async function preparedQuery<
+  T extends QueryResultRow = QueryResultRow,
+>(name: string, text: string, params?: unknown[]): Promise<QueryResult<T>> {
+  return await runQuery<T>({ name, text, values: params });
+}
+
 /**
  * Get a client from the pool for transaction support
  */
@@ -121,12 +162,99 @@ export async function withTransaction<T>(
   }
 }
 
+/**
+ * Execute one statement for many parameter sets on a single connection
+ * inside a transaction
+ * Pass a name for fixed, hot statements to parse them only once per
+ * connection (as with preparedQuery); never name dynamically built SQL,
+ * since named statements stay allocated on every pooled connection
+ */
+export async function executeMany(
+  text: string,
+  paramSets: unknown[][],
+  name?: string
+): Promise<number> {
+  if (paramSets.length === 0) {
+    return 0;
+  }
+
+  return await withTransaction(async (client) => {
+    let affected = 0;
+    for (const values of paramSets) {
+      const config: QueryConfig<unknown[]> = name
+        ? { name, text, values }
+        : { text, values };
+      const result = await client.query(config);
+      affected += result.rowCount ?? 0;
+    }
+    return affected;
+  });
+}
+
+/**
+ * Insert many rows with multi-row VALUES statements in a single transaction
+ * Rows are split only as needed to stay under the bind parameter limit
+ */
+export async function insertMany(
+  table: string,
+  columns: string[],
+  rows: unknown[][]
+): Promise<number> {
+  if (rows.length === 0 || columns.length === 0) {
+    return 0;
+  }
+
+  // A short row would bind NULLs and a long one would lose values silently
+  const badRow = rows.findIndex((row) => row.length !== columns.length);
+  if (badRow !== -1) {
+    throw new Error(
+      `insertMany row ${badRow} has ${rows[badRow]?.length} values, ` +
+        `expected ${columns.length}`
+    );
+  }
+
+  const rowsPerStatement = Math.floor(MAX_QUERY_PARAMS / columns.length);
+
+  return await withTransaction(async (client) => {
+    const quotedTable = table
+      .split(".")
+      .map((part) => client.escapeIdentifier(part))
+      .join(".");
+    const quotedColumns = columns
+      .map((column) => client.escapeIdentifier(column))
+      .join(", ");
+
+    let inserted = 0;
+    for (let i = 0; i < rows.length; i += rowsPerStatement) {
+      const batch = rows.slice(i, i + rowsPerStatement);
+      const values: unknown[] = [];
+      const tuples = batch.map((row) => {
+        const placeholders = columns.map((_, col) => {
+          values.push(row[col]);
+          return `$${values.length}`;
+        });
+        return `(${placeholders.join(", ")})`;
+      });
+
+      const result = await client.query(
+        `INSERT INTO ${quotedTable} (${quotedColumns}) VALUES ${tuples.join(", ")}`,
+        values
+      );
+      inserted += result.rowCount ?? 0;
+    }
+    return inserted;
+  });
+}
+
 /**
  * Check database connection health
  */
 export async function healthCheck(): Promise<boolean> {
   try {
-    const result = await query<{ now: Date }>("SELECT NOW() as now");
+    const result = await preparedQuery<{ now: Date }>(
+      "health_check",
+      "SELECT NOW() as now"
+    );
     return result.rows.length > 0;
   } catch {
     return false;
@@ -148,8 +276,11 @@ export default {
   initializePool,
   getPool,
   query,
+  preparedQuery,
   getClient,
   withTransaction,
+  executeMany,
+  insertMany,
   healthCheck,
   closePool,
 };
@@ -6,8 +6,11 @@ export {
   initializePool,
   getPool,
   query,
+  preparedQuery,
   getClient,
   withTransaction,
+  executeMany,
+  insertMany,
   healthCheck as dbHealthCheck,
   closePool,
 } from "./connection.js";
@@ -15,6 +18,7 @@ export {
 export {
   initializeRedis,
   getRedisClient,
+  execPipeline,
   cache,
   redisHealthCheck,
   closeRedis,
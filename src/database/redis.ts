@@ -3,12 +3,84 @@
  * Manages Redis connection for caching and message queuing
  */
 
-import Redis, { RedisOptions } from "ioredis";
+import Redis, { ChainableCommander, RedisOptions } from "ioredis";
 
 import { getConfig } from "@/config/index.js";
+import type { RedisConfig } from "@/types/index.js";
 import { logger } from "@/utils/logger.js";
 
 let redisClient: Redis | null = null;
+let unlinkSupported = true;
+
+/**
+ * Keys requested per SCAN step
+ */
+const SCAN_COUNT = 500;
+
+/**
+ * Matches the leading character of anything JSON.stringify can produce
+ */
+const JSON_START = /^[{["\-\d]|^(?:true|false|null)$/;
+
+/**
+ * Deserialize a cached value, returning plain strings as-is
+ * without paying for a thrown SyntaxError on every read
+ */
+function deserialize<T>(value: string): T {
+  if (!JSON_START.test(value)) {
+    return value as unknown as T;
+  }
+  try {
+    return JSON.parse(value) as T;
+  } catch {
+    return value as unknown as T;
+  }
+}
+
+/**
+ * Serialize a value for storage; strings and Buffers are stored as-is
+ */
+function serialize(value: unknown): string | Buffer {
+  return typeof value === "string" || Buffer.isBuffer(value)
+    ? value
+    : JSON.stringify(value);
+}
+
+/**
+ * Delete keys with UNLINK so memory is reclaimed off the Redis main thread,
+ * falling back to DEL on servers older than 4.0
+ */
+async function unlinkKeys(client: Redis, keys: string[]): Promise<number> {
+  if (unlinkSupported) {
+    try {
+      return await client.unlink(...keys);
+    } catch (error) {
+      const unknown =
+        error instanceof Error && /unknown command/i.test(error.message);
+      if (!unknown) {
+        throw error;
+      }
+      unlinkSupported = false;
+    }
+  }
+  return await client.del(...keys);
+}
+
+/**
+ * Run a pipeline and throw the first command error
+ * exec() resolves with [err, result] pairs instead of rejecting, so a failed
+ * command would otherwise go unnoticed
+ */
+export async function execPipeline(
+  pipeline: ChainableCommander
+): Promise<unknown[]> {
+  const results = (await pipeline.exec()) ?? [];
+  const failed = results.find(([err]) => err);
+  if (failed?.[0]) {
+    throw failed[0];
+  }
+  return results.map(([, result]) => result);
+}
 
 /**
  * Parse Redis URL into connection options
@@ -34,8 +106,11 @@ export function initializeRedis(url?: string): Redis {
     return redisClient;
   }
 
-  const redisUrl = url ?? getConfig().redis.url;
-  const options = parseRedisUrl(redisUrl);
+  const redisConfig: RedisConfig = url ? { url } : getConfig().redis;
+  const options = parseRedisUrl(redisConfig.url);
+  if (redisConfig.socketPath) {
+    options.path = redisConfig.socketPath;
+  }
 
   redisClient = new Redis({
     ...options,
@@ -88,20 +163,24 @@ export const cache = {
     if (!value) {
       return null;
     }
-    try {
-      return JSON.parse(value) as T;
-    } catch {
-      return value as unknown as T;
-    }
+    return deserialize<T>(value);
+  },
+
+  /**
+   * Get a raw value from cache without UTF-8 decoding the reply
+   */
+  async getBuffer(key: string): Promise<Buffer | null> {
+    const client = getRedisClient();
+    return await client.getBuffer(key);
   },
 
   /**
    * Set a value in cache with optional TTL (in seconds)
+   * Strings and Buffers are stored as-is, everything else as JSON
    */
   async set(key: string, value: unknown, ttlSeconds?: number): Promise<void> {
     const client = getRedisClient();
-    const serialized =
-      typeof value === "string" ? value : JSON.stringify(value);
+    const serialized = serialize(value);
 
     if (ttlSeconds) {
       await client.setex(key, ttlSeconds, serialized);
@@ -110,12 +189,53 @@ export const cache = {
     }
   },
 
+  /**
+   * Store a float vector (e.g. an embedding) as raw float32 bytes
+   * Use this instead of set for embeddings: 4 bytes per element rather than
+   * ~15 as JSON, and no number parsing on read
+   */
+  async setVector(
+    key: string,
+    vector: ArrayLike<number>,
+    ttlSeconds?: number
+  ): Promise<void> {
+    const floats =
+      vector instanceof Float32Array ? vector : Float32Array.from(vector);
+    const bytes = Buffer.from(
+      floats.buffer,
+      floats.byteOffset,
+      floats.byteLength
+    );
+    await this.set(key, bytes, ttlSeconds);
+  },
+
+  /**
+   * Get a float vector stored with setVector
+   */
+  async getVector(key: string): Promise<Float32Array | null> {
+    const bytes = await this.getBuffer(key);
+    if (!bytes) {
+      return null;
+    }
+    if (bytes.length % Float32Array.BYTES_PER_ELEMENT !== 0) {
+      throw new Error(
+        `Cached value at ${key} is not a float32 vector (${bytes.length} bytes)`
+      );
+    }
+    // Copy out: reply Buffers may be pool slices without 4-byte alignment
+    const floats = new Float32Array(
+      bytes.length / Float32Array.BYTES_PER_ELEMENT
+    );
+    new Uint8Array(floats.buffer).set(bytes);
+    return floats;
+  },
+
   /**
    * Delete a key from cache
    */
   async delete(key: string): Promise<void> {
     const client = getRedisClient();
-    await client.del(key);
+    await unlinkKeys(client, [key]);
   },
 
   /**
@@ -139,18 +259,52 @@ export const cache = {
    * Get multiple keys
    */
   async mget<T>(keys: string[]): Promise<(T | null)[]> {
+    if (keys.length === 0) {
+      return [];
+    }
     const client = getRedisClient();
     const values = await client.mget(...keys);
-    return values.map((value) => {
-      if (!value) {
-        return null;
-      }
-      try {
-        return JSON.parse(value) as T;
-      } catch {
-        return value as unknown as T;
+    return values.map((value) => (value ? deserialize<T>(value) : null));
+  },
+
+  /**
+   * Set multiple keys in a single round trip with optional TTL (in seconds)
+   */
+  async mset(
+    entries: Record<string, unknown>,
+    ttlSeconds?: number
+  ): Promise<void> {
+    const keys = Object.keys(entries);
+    if (keys.length === 0) {
+      return;
+    }
+    const client = getRedisClient();
+
+    if (!ttlSeconds) {
+      const serialized: Record<string, string | Buffer> = {};
+      for (const key of keys) {
+        serialized[key] = serialize(entries[key]);
       }
-    });
+      await client.mset(serialized);
+      return;
+    }
+
+    const pipeline = client.pipeline();
+    for (const key of keys) {
+      pipeline.setex(key, ttlSeconds, serialize(entries[key]));
+    }
+    await execPipeline(pipeline);
+  },
+
+  /**
+   * Delete multiple keys in a single round trip
+   */
+  async mdelete(keys: string[]): Promise<number> {
+    if (keys.length === 0) {
+      return 0;
+    }
+    const client = getRedisClient();
+    return await unlinkKeys(client, keys);
   },
 
   /**
@@ -161,12 +315,42 @@ export const cache = {
     return await client.incr(key);
   },
 
+  /**
+   * Iterate keys matching a pattern in batches using non-blocking SCAN
+   * (SCAN may repeat keys across batches)
+   */
+  async *iterKeys(pattern: string): AsyncGenerator<string[]> {
+    if (pattern === "*") {
+      logger.warn("Scanning entire Redis keyspace", { pattern });
+    }
+    const client = getRedisClient();
+    let cursor = "0";
+    do {
+      const [next, batch] = await client.scan(
+        cursor,
+        "MATCH",
+        pattern,
+        "COUNT",
+        SCAN_COUNT
+      );
+      cursor = next;
+      if (batch.length > 0) {
+        yield batch;
+      }
+    } while (cursor !== "0");
+  },
+
   /**
    * Get all keys matching a pattern
    */
   async keys(pattern: string): Promise<string[]> {
-    const client = getRedisClient();
-    return await client.keys(pattern);
+    const found = new Set<string>();
+    for await (const batch of this.iterKeys(pattern)) {
+      for (const key of batch) {
+        found.add(key);
+      }
+    }
+    return [...found];
   },
 };
 
@@ -197,6 +381,7 @@ export async function closeRedis(): Promise<void> {
 export default {
   initializeRedis,
   getRedisClient,
+  execPipeline,
   cache,
   redisHealthCheck,
   closeRedis,
@@ -94,13 +94,21 @@ export class Qwen3TtsProvider implements IVoiceProvider {
 
       let errorOutput = "";
 
+      // Only decode output for debug logs when debug logging is on
+      const debugEnabled = logger.isLevelEnabled("debug");
+
       python.stdout.on("data", (data: Buffer) => {
-        logger.debug(`Qwen3-TTS: ${data.toString().trim()}`);
+        if (debugEnabled) {
+          logger.debug(`Qwen3-TTS: ${data.toString().trim()}`);
+        }
       });
 
       python.stderr.on("data", (data: Buffer) => {
-        errorOutput += data.toString();
-        logger.debug(`Qwen3-TTS stderr: ${data.toString().trim()}`);
+        const text = data.toString();
+        errorOutput += text;
+        if (debugEnabled) {
+          logger.debug(`Qwen3-TTS stderr: ${text.trim()}`);
+        }
       });
 
       python.on("close", (code) => {
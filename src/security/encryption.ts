@@ -13,13 +13,44 @@ const IV_LENGTH = 16; // 128 bits
 const AUTH_TAG_LENGTH = 16; // 128 bits
 const KEY_LENGTH = 32; // 256 bits
 
+const DERIVED_KEY_CACHE_SIZE = 1024;
+
+/**
+ * Recently derived keys by salt (least recently used first). PBKDF2 costs
+ * tens of milliseconds of blocking CPU per call, and the same records are
+ * decrypted on every read.
+ */
+const derivedKeys = new Map<string, Buffer>();
+let derivedKeysFor: string | null = null;
+
 /**
  * Derive a proper 256-bit key from the encryption key in config
  * Uses PBKDF2 for key derivation
  */
 function deriveKey(salt: Buffer): Buffer {
   const configKey = getConfig().security.encryptionKey;
-  return crypto.pbkdf2Sync(configKey, salt, 100000, KEY_LENGTH, "sha256");
+  if (configKey !== derivedKeysFor) {
+    derivedKeys.clear();
+    derivedKeysFor = configKey;
+  }
+
+  const cacheKey = salt.toString("hex");
+  const cached = derivedKeys.get(cacheKey);
+  if (cached) {
+    derivedKeys.delete(cacheKey);
+    derivedKeys.set(cacheKey, cached);
+    return cached;
+  }
+
+  const key = crypto.pbkdf2Sync(configKey, salt, 100000, KEY_LENGTH, "sha256");
+  derivedKeys.set(cacheKey, key);
+  if (derivedKeys.size > DERIVED_KEY_CACHE_SIZE) {
+    const oldest = derivedKeys.keys().next().value;
+    if (oldest !== undefined) {
+      derivedKeys.delete(oldest);
+    }
+  }
+  return key;
 }
 
 /**
@@ -6,6 +6,7 @@
 
 import { Redis } from "ioredis";
 
+import { execPipeline } from "../database/redis.js";
 import {
   ConversationState,
   ConversationStatus,
@@ -91,9 +92,13 @@ export class ConversationService {
     const historyKey = `${this.CACHE_PREFIX}${fullTurn.userId}:history`;
     const serialized = JSON.stringify(fullTurn);
 
-    // RPUSH to add to end, LTRIM to keep last 50
-    await this.redis.rpush(historyKey, serialized);
-    await this.redis.ltrim(historyKey, -50, -1);
+    // RPUSH to add to end, LTRIM to keep last 50, in one round trip
+    await execPipeline(
+      this.redis
+        .pipeline()
+        .rpush(historyKey, serialized)
+        .ltrim(historyKey, -50, -1)
+    );
 
     logger.debug("Conversation turn recorded", {
       userId: fullTurn.userId,
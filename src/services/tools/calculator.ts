@@ -1,8 +1,19 @@
-import { evaluate } from "mathjs";
-
 import { Tool, ToolCategory } from "../../types/tool.js";
 import { logger } from "../../utils/logger.js";
 
+// mathjs is one of the heaviest modules in the app; load it on first use
+// rather than at startup, and share the in-flight import across calls.
+// A failed import is not cached, so the next call retries it.
+let mathjs: Promise<typeof import("mathjs")> | null = null;
+
+function loadMathjs(): Promise<typeof import("mathjs")> {
+    mathjs ??= import("mathjs").catch((error: unknown) => {
+        mathjs = null;
+        throw error;
+    });
+    return mathjs;
+}
+
 export class CalculatorTool implements Tool {
     name = "calculator";
     description = "Evaluate mathematical expressions";
@@ -15,6 +26,7 @@ export class CalculatorTool implements Tool {
         }
 
         try {
+            const { evaluate } = await loadMathjs();
             // valueOf is needed because mathjs might return an object
             const result = evaluate(expression, this.createScope());
 
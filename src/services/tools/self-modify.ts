@@ -15,6 +15,7 @@ import { Redis } from "ioredis";
 import { promises as fs } from "fs";
 import path from "path";
 
+import { execPipeline } from "../../database/redis.js";
 import { Tool, ToolCategory } from "../../types/tool.js";
 import { logger } from "../../utils/logger.js";
 import { audit, AuditEventType } from "../../security/audit.js";
@@ -172,14 +173,16 @@ export class SelfModifyTool implements Tool {
       status: "pending",
     };
 
-    // Store in Redis
+    // Store in Redis, along with the proposal ID for user (for listing)
     const key = this.getCacheKey(userId, proposalId);
-    await this.redis.setex(key, this.PENDING_TTL, JSON.stringify(modification));
-
-    // Also store proposal ID for user (for listing)
     const userProposalsKey = `${this.CACHE_PREFIX}user:${userId}:proposals`;
-    await this.redis.sadd(userProposalsKey, proposalId);
-    await this.redis.expire(userProposalsKey, this.PENDING_TTL);
+    await execPipeline(
+      this.redis
+        .pipeline()
+        .setex(key, this.PENDING_TTL, JSON.stringify(modification))
+        .sadd(userProposalsKey, proposalId)
+        .expire(userProposalsKey, this.PENDING_TTL)
+    );
 
     // Audit log
     await audit(AuditEventType.SELF_MODIFY_PROPOSE, {
@@ -237,15 +240,18 @@ export class SelfModifyTool implements Tool {
       // Find by verification code
       const userProposalsKey = `${this.CACHE_PREFIX}user:${userId}:proposals`;
       const proposalIds = await this.redis.smembers(userProposalsKey);
+      const values = proposalIds.length > 0
+        ? await this.redis.mget(
+            ...proposalIds.map((pid) => this.getCacheKey(userId, pid))
+          )
+        : [];
 
-      for (const pid of proposalIds) {
-        const key = this.getCacheKey(userId, pid);
-        const data = await this.redis.get(key);
+      for (const [index, data] of values.entries()) {
         if (data) {
           const mod = JSON.parse(data) as PendingModification;
           if (mod.verificationCode === verificationCode && mod.status === "pending") {
             modification = mod;
-            proposalId = pid;
+            proposalId = proposalIds[index];
             break;
           }
         }
@@ -349,9 +355,10 @@ export class SelfModifyTool implements Tool {
       expiresAt: string;
     }> = [];
 
-    for (const pid of proposalIds) {
-      const key = this.getCacheKey(userId, pid);
-      const data = await this.redis.get(key);
+    const keys = proposalIds.map((pid) => this.getCacheKey(userId, pid));
+    const values = await this.redis.mget(...keys);
+
+    for (const data of values) {
       if (data) {
         const mod = JSON.parse(data) as PendingModification;
         proposals.push({
@@ -384,10 +391,11 @@ export class SelfModifyTool implements Tool {
 
     const modification = JSON.parse(data) as PendingModification;
     modification.status = "rejected";
-    await this.redis.del(key);
 
     const userProposalsKey = `${this.CACHE_PREFIX}user:${userId}:proposals`;
-    await this.redis.srem(userProposalsKey, proposalId);
+    await execPipeline(
+      this.redis.pipeline().del(key).srem(userProposalsKey, proposalId)
+    );
 
     logger.info(`Self-modification cancelled by user ${userId}: ${proposalId}`);
 
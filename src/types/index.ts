@@ -162,6 +162,7 @@ export interface DatabaseConfig {
 
 export interface RedisConfig {
   url: string;
+  socketPath?: string;
 }
 
 export interface SecurityConfig {
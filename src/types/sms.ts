@@ -211,34 +211,53 @@ export function chunkMessage(
     return [message];
   }
 
+  // Slice segments straight out of the message, breaking at the last space
+  // that fits, instead of splitting into words and re-concatenating them
   const chunks: string[] = [];
-  const words = message.split(" ");
-  let currentChunk = "";
-
-  for (const word of words) {
-    if (currentChunk.length + word.length + 1 <= maxLength) {
-      currentChunk += (currentChunk ? " " : "") + word;
-    } else {
-      if (currentChunk) {
-        chunks.push(currentChunk);
+  let start = 0;
+
+  while (message.length - start > maxLength) {
+    if (message[start] === " ") {
+      // Skip separator spaces so no chunk starts with (or is only) whitespace
+      start += 1;
+      continue;
+    }
+    let end = message.lastIndexOf(" ", start + maxLength);
+    if (end < start) {
+      // Single word longer than maxLength: keep it whole in its own chunk
+      end = message.indexOf(" ", start + maxLength);
+      if (end === -1) {
+        break;
       }
-      currentChunk = word;
     }
+    chunks.push(message.slice(start, end));
+    start = end + 1;
   }
 
-  if (currentChunk) {
-    chunks.push(currentChunk);
+  while (message[start] === " ") {
+    start += 1;
+  }
+  if (start < message.length) {
+    chunks.push(message.slice(start));
   }
 
   return chunks;
 }
 
+const NON_DIGITS = /\D+/g;
+
 /**
  * Helper: Format phone number to E.164
  */
 export function formatPhoneNumber(phone: string): string {
   // Remove all non-digit characters
-  const digits = phone.replace(/\D/g, "");
+  const digits = phone.replace(NON_DIGITS, "");
+
+  // Already international (+...): the country code is part of the digits, so
+  // skip the US heuristics below (e.g. "+65 9123 4567" has 10 digits)
+  if (phone.trimStart().startsWith("+")) {
+    return "+" + digits;
+  }
 
   // If it starts with 1 and has 11 digits, it's already E.164-ish
   if (digits.length === 11 && digits.startsWith("1")) {
@@ -250,12 +269,7 @@ export function formatPhoneNumber(phone: string): string {
     return "+1" + digits;
   }
 
-  // If it already has a + and looks like E.164, return as-is
-  if (phone.startsWith("+")) {
-    return phone;
-  }
-
-  // Otherwise, add + prefix
+  // Otherwise unknown: keep the digits and add the + prefix
   return "+" + digits;
 }
 
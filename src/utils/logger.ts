@@ -3,7 +3,7 @@
  * Provides structured logging with different levels
  */
 
-type LogLevel = "debug" | "info" | "warn" | "error";
+export type LogLevel = "debug" | "info" | "warn" | "error";
 
 interface LogEntry {
   timestamp: string;
@@ -19,6 +19,80 @@ const LOG_LEVELS: Record<LogLevel, number> = {
   error: 3,
 };
 
+/**
+ * Buffers log lines and writes them once per event loop turn, so a burst of
+ * log calls costs one write instead of one per line (stdout writes to files
+ * and pipes are synchronous and would otherwise block the event loop)
+ */
+class LineBuffer {
+  private lines: string[] = [];
+  private scheduled = false;
+
+  constructor(private stream: NodeJS.WritableStream) {}
+
+  push(line: string): void {
+    this.lines.push(line);
+    if (!this.scheduled) {
+      this.scheduled = true;
+      setImmediate(() => this.flush());
+    }
+  }
+
+  flush(): void {
+    this.scheduled = false;
+    if (this.lines.length === 0) {
+      return;
+    }
+    const chunk = `${this.lines.join("\n")}\n`;
+    this.lines = [];
+    this.stream.write(chunk);
+  }
+}
+
+// One buffer and exit hook per process, even if this module is evaluated
+// again (test module resets, watch-mode reloads)
+const STDOUT_BUFFER: unique symbol = Symbol.for("ai-assistant.logger.stdout");
+const processGlobals = globalThis as typeof globalThis & {
+  [STDOUT_BUFFER]?: LineBuffer;
+};
+
+function getStdoutBuffer(): LineBuffer {
+  const existing = processGlobals[STDOUT_BUFFER];
+  if (existing) {
+    return existing;
+  }
+  const buffer = new LineBuffer(process.stdout);
+  processGlobals[STDOUT_BUFFER] = buffer;
+  // Drain anything still queued when the process exits
+  process.on("exit", () => buffer.flush());
+  return buffer;
+}
+
+const stdoutBuffer = getStdoutBuffer();
+
+const LEVEL_LABELS: Record<LogLevel, string> = {
+  debug: "DEBUG",
+  info: "INFO",
+  warn: "WARN",
+  error: "ERROR",
+};
+
+const writeBuffered = (line: string): void => stdoutBuffer.push(line);
+const writeImmediate = (line: string): void => {
+  // Drain buffered lines first so merged stdout/stderr stays in log order
+  stdoutBuffer.flush();
+  process.stderr.write(`${line}\n`);
+};
+
+// Warnings and errors go straight to stderr so they are never lost in a
+// crash; routine output is batched
+const LEVEL_WRITERS: Record<LogLevel, (line: string) => void> = {
+  debug: writeBuffered,
+  info: writeBuffered,
+  warn: writeImmediate,
+  error: writeImmediate,
+};
+
 class Logger {
   private minLevel: LogLevel;
 
@@ -30,12 +104,15 @@ class Logger {
     this.minLevel = level;
   }
 
-  private shouldLog(level: LogLevel): boolean {
+  /**
+   * Check a level before building expensive messages or context objects
+   */
+  isLevelEnabled(level: LogLevel): boolean {
     return LOG_LEVELS[level] >= LOG_LEVELS[this.minLevel];
   }
 
   private formatEntry(entry: LogEntry): string {
-    const base = `[${entry.timestamp}] ${entry.level.toUpperCase()}: ${entry.message}`;
+    const base = `[${entry.timestamp}] ${LEVEL_LABELS[entry.level]}: ${entry.message}`;
     if (entry.context) {
       return `${base} ${JSON.stringify(entry.context)}`;
     }
@@ -47,7 +124,7 @@ class Logger {
     message: string,
     context?: Record<string, unknown>
   ): void {
-    if (!this.shouldLog(level)) {
+    if (!this.isLevelEnabled(level)) {
       return;
     }
 
@@ -60,18 +137,7 @@ class Logger {
 
     const formatted = this.formatEntry(entry);
 
-    switch (level) {
-      case "debug":
-      case "info":
-        console.info(formatted);
-        break;
-      case "warn":
-        console.warn(formatted);
-        break;
-      case "error":
-        console.error(formatted);
-        break;
-    }
+    LEVEL_WRITERS[level](formatted);
   }
 
   debug(message: string, context?: Record<string, unknown>): void {
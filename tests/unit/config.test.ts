@@ -34,6 +34,56 @@ describe("Configuration Module", () => {
     expect(config.port).toBe(4000);
   });
 
+  it("should use Unix sockets when socket paths are set", async () => {
+    process.env["NODE_ENV"] = "development";
+    process.env["DATABASE_URL"] = "postgresql://postgres@localhost:5432/app";
+    process.env["DB_SOCKET_DIR"] = "/var/run/postgresql";
+    process.env["REDIS_SOCKET_PATH"] = "/var/run/redis/redis.sock";
+    const { loadConfig } = await import("@/config/index.js");
+
+    const config = loadConfig();
+
+    const dbUrl = new URL(config.database.url);
+    expect(dbUrl.searchParams.get("host")).toBe("/var/run/postgresql");
+    expect(dbUrl.pathname).toBe("/app");
+    expect(config.redis.socketPath).toBe("/var/run/redis/redis.sock");
+  });
+
+  it("should disable database SSL over a Unix socket", async () => {
+    process.env["NODE_ENV"] = "production";
+    process.env["DATABASE_URL"] =
+      "postgresql://postgres@localhost:5432/app?sslmode=require";
+    process.env["DB_SSL"] = "true";
+    process.env["DB_SOCKET_DIR"] = "/var/run/postgresql";
+    const { loadConfig } = await import("@/config/index.js");
+
+    const config = loadConfig();
+
+    expect(config.database.ssl).toBe(false);
+    expect(config.database.url).not.toContain("sslmode");
+  });
+
+  it("should default database SSL on in production over TCP", async () => {
+    process.env["NODE_ENV"] = "production";
+    delete process.env["DB_SSL"];
+    delete process.env["DB_SOCKET_DIR"];
+    const { loadConfig } = await import("@/config/index.js");
+
+    expect(loadConfig().database.ssl).toBe(true);
+  });
+
+  it("should omit socket paths by default", async () => {
+    process.env["NODE_ENV"] = "development";
+    delete process.env["DB_SOCKET_DIR"];
+    delete process.env["REDIS_SOCKET_PATH"];
+    const { loadConfig } = await import("@/config/index.js");
+
+    const config = loadConfig();
+
+    expect(config.database.url).not.toContain("host=");
+    expect(config.redis.socketPath).toBeUndefined();
+  });
+
   it("should validate production configuration", async () => {
     process.env["NODE_ENV"] = "production";
     process.env["JWT_SECRET"] = "production-secure-secret-key-here";
@@ -0,0 +1,222 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+
+const mockClient = vi.hoisted(() => ({
+  query: vi.fn(),
+  release: vi.fn(),
+  escapeIdentifier: (value: string): string =>
+    `"${value.replace(/"/g, '""')}"`,
+}));
+
+const mockPool = vi.hoisted(() => ({
+  connect: vi.fn(),
+  query: vi.fn(),
+  end: vi.fn(),
+  on: vi.fn(),
+}));
+
+vi.mock("pg", () => ({
+  Pool: function MockPool() {
+    return mockPool;
+  },
+}));
+
+vi.mock("../../src/utils/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    isLevelEnabled: vi.fn(() => false),
+  },
+}));
+
+type ConnectionModule = typeof import("../../src/database/connection.js");
+
+/**
+ * Text and values of every client query other than BEGIN/COMMIT/ROLLBACK
+ */
+const statements = (): { text: string; values: unknown[] }[] =>
+  mockClient.query.mock.calls
+    .filter(([q]) => typeof q !== "string" || q.startsWith("INSERT"))
+    .map(([q, values]) => (typeof q === "string" ? { text: q, values } : q));
+
+describe("Database connection", () => {
+  let db: ConnectionModule;
+
+  beforeEach(async () => {
+    vi.clearAllMocks();
+    mockPool.connect.mockResolvedValue(mockClient);
+    mockClient.query.mockImplementation(
+      async (q: unknown, values?: unknown[]) => {
+        if (typeof q === "string" && !q.startsWith("INSERT")) {
+          return { rowCount: null };
+        }
+        // One row per INSERT tuple (3 columns in these tests), one per execute
+        return { rowCount: values ? values.length / 3 : 1 };
+      }
+    );
+    // Fresh module per test: the pool is module state
+    vi.resetModules();
+    db = await import("../../src/database/connection.js");
+    db.initializePool({
+      connectionString: "postgresql://localhost/test",
+      maxConnections: 1,
+      ssl: false,
+    });
+  });
+
+  describe("preparedQuery", () => {
+    it("should send the statement name with the query", async () => {
+      mockPool.query.mockResolvedValue({ rows: [{ id: 42 }], rowCount: 1 });
+      const text = "SELECT id FROM users WHERE phone = $1";
+
+      const result = await db.preparedQuery("user_by_phone", text, ["+1555"]);
+
+      expect(result.rows).toEqual([{ id: 42 }]);
+      expect(mockPool.query).toHaveBeenCalledWith({
+        name: "user_by_phone",
+        text,
+        values: ["+1555"],
+      });
+    });
+
+    it("should run the health check as a prepared statement", async () => {
+      mockPool.query.mockResolvedValue({ rows: [{ now: new Date() }] });
+
+      expect(await db.healthCheck()).toBe(true);
+      expect(mockPool.query).toHaveBeenCalledWith(
+        expect.objectContaining({ name: "health_check" })
+      );
+    });
+
+    it("should leave plain queries unnamed", async () => {
+      mockPool.query.mockResolvedValue({ rows: [], rowCount: 0 });
+
+      await db.query("SELECT 1", []);
+
+      expect(mockPool.query).toHaveBeenCalledWith({
+        text: "SELECT 1",
+        values: [],
+      });
+    });
+  });
+
+  describe("executeMany", () => {
+    it("should skip the transaction for no parameter sets", async () => {
+      expect(await db.executeMany("UPDATE t SET a = $1", [])).toBe(0);
+      expect(mockPool.connect).not.toHaveBeenCalled();
+    });
+
+    it("should run every set in one transaction", async () => {
+      const text = "UPDATE t SET a = $1 WHERE id = $2";
+
+      expect(await db.executeMany(text, [[1, "x"], [2, "y"]])).toBe(2);
+
+      const calls = mockClient.query.mock.calls.map(([q]) => q);
+      expect(calls[0]).toBe("BEGIN");
+      expect(calls[calls.length - 1]).toBe("COMMIT");
+      // Unnamed by default, so ad hoc SQL leaves no prepared statements behind
+      expect(statements()).toEqual([
+        { text, values: [1, "x"] },
+        { text, values: [2, "y"] },
+      ]);
+      expect(mockClient.release).toHaveBeenCalledTimes(1);
+    });
+
+    it("should use the caller's statement name", async () => {
+      const text = "DELETE FROM t WHERE id = $1";
+
+      await db.executeMany(text, [[1], [2]], "delete_t");
+
+      expect(statements()).toEqual([
+        { name: "delete_t", text, values: [1] },
+        { name: "delete_t", text, values: [2] },
+      ]);
+    });
+
+    it("should roll back and release on failure", async () => {
+      mockClient.query.mockImplementation(async (q: unknown) => {
+        if (typeof q !== "string") {
+          throw new Error("duplicate key");
+        }
+        return { rowCount: null };
+      });
+
+      await expect(
+        db.executeMany("INSERT INTO t VALUES ($1)", [[1]])
+      ).rejects.toThrow("duplicate key");
+      expect(mockClient.query).toHaveBeenCalledWith("ROLLBACK");
+      expect(mockClient.release).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe("insertMany", () => {
+    it("should skip the transaction for no rows or columns", async () => {
+      expect(await db.insertMany("t", ["a"], [])).toBe(0);
+      expect(await db.insertMany("t", [], [[1]])).toBe(0);
+      expect(mockPool.connect).not.toHaveBeenCalled();
+    });
+
+    it("should reject rows that don't match the column count", async () => {
+      await expect(
+        db.insertMany("t", ["a", "b"], [[1, 2], [3]])
+      ).rejects.toThrow("insertMany row 1 has 1 values, expected 2");
+      await expect(
+        db.insertMany("t", ["a", "b"], [[1, 2, 3]])
+      ).rejects.toThrow("insertMany row 0 has 3 values, expected 2");
+      expect(mockPool.connect).not.toHaveBeenCalled();
+    });
+
+    it("should quote schema, table and column identifiers", async () => {
+      await db.insertMany(
+        "public.user events",
+        ["id", 'na"me', "score"],
+        [[1, "a", 2]]
+      );
+
+      expect(statements()[0]?.text).toBe(
+        'INSERT INTO "public"."user events" ("id", "na""me", "score") ' +
+          "VALUES ($1, $2, $3)"
+      );
+    });
+
+    it("should number placeholders across rows", async () => {
+      const inserted = await db.insertMany(
+        "t",
+        ["a", "b", "c"],
+        [
+          [1, 2, 3],
+          [4, 5, 6],
+        ]
+      );
+
+      expect(inserted).toBe(2);
+      expect(statements()).toEqual([
+        {
+          text:
+            'INSERT INTO "t" ("a", "b", "c") ' +
+            "VALUES ($1, $2, $3), ($4, $5, $6)",
+          values: [1, 2, 3, 4, 5, 6],
+        },
+      ]);
+    });
+
+    it("should split at the parameter limit and renumber", async () => {
+      // 3 columns fit 21845 rows (65535 parameters) per statement
+      const rows = Array.from({ length: 21847 }, (_, i) => [i, i, i]);
+
+      expect(await db.insertMany("t", ["a", "b", "c"], rows)).toBe(21847);
+
+      const [first, second] = statements();
+      expect(statements()).toHaveLength(2);
+      expect(first?.values).toHaveLength(65535);
+      expect(first?.text.endsWith("($65533, $65534, $65535)")).toBe(true);
+      expect(second?.text).toBe(
+        'INSERT INTO "t" ("a", "b", "c") VALUES ($1, $2, $3), ($4, $5, $6)'
+      );
+      expect(second?.values).toEqual([
+        21845, 21845, 21845, 21846, 21846, 21846,
+      ]);
+    });
+  });
+});
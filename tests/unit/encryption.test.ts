@@ -1,4 +1,5 @@
-import { describe, it, expect, beforeEach, vi } from "vitest";
+import crypto from "crypto";
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
 
 describe("Encryption Module", () => {
   beforeEach(() => {
@@ -7,6 +8,11 @@ describe("Encryption Module", () => {
     process.env["ENCRYPTION_KEY"] = "test-encryption-key-for-testing-purposes";
   });
 
+  afterEach(() => {
+    vi.restoreAllMocks();
+    vi.doUnmock("@/config/index.js");
+  });
+
   describe("encrypt/decrypt", () => {
     it("should encrypt and decrypt text correctly", async () => {
       const { encrypt, decrypt } = await import("@/security/encryption.js");
@@ -21,6 +27,36 @@ describe("Encryption Module", () => {
       expect(decrypted).toBe(plaintext);
     });
 
+    it("should derive the key once per ciphertext", async () => {
+      const { encrypt, decrypt } = await import("@/security/encryption.js");
+      const pbkdf2 = vi.spyOn(crypto, "pbkdf2Sync");
+
+      const encrypted = encrypt("Read many times");
+
+      expect(decrypt(encrypted)).toBe("Read many times");
+      expect(decrypt(encrypted)).toBe("Read many times");
+      expect(pbkdf2).toHaveBeenCalledTimes(1);
+    });
+
+    it("should drop cached keys when the configured key changes", async () => {
+      const security = { encryptionKey: "first-encryption-key-for-testing" };
+      vi.doMock("@/config/index.js", () => ({
+        getConfig: () => ({ security }),
+      }));
+      const { encrypt, decrypt } = await import("@/security/encryption.js");
+      const pbkdf2 = vi.spyOn(crypto, "pbkdf2Sync");
+
+      const encrypted = encrypt("Rotated");
+      expect(decrypt(encrypted)).toBe("Rotated");
+      expect(pbkdf2).toHaveBeenCalledTimes(1);
+
+      security.encryptionKey = "second-encryption-key-for-testing";
+
+      // Re-derived with the new key, so the old ciphertext no longer opens
+      expect(() => decrypt(encrypted)).toThrow(/Decryption failed/);
+      expect(pbkdf2).toHaveBeenCalledTimes(2);
+    });
+
     it("should produce different ciphertext for same plaintext (random IV)", async () => {
       const { encrypt } = await import("@/security/encryption.js");
 
@@ -0,0 +1,121 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+
+const STDOUT_BUFFER = Symbol.for("ai-assistant.logger.stdout");
+
+type LoggerModule = typeof import("../../src/utils/logger.js");
+
+const nextTick = (): Promise<void> =>
+  new Promise((resolve) => setImmediate(resolve));
+
+describe("Logger", () => {
+  let writes: ["stdout" | "stderr", string][];
+  let processOn: ReturnType<typeof vi.fn>;
+
+  const loadLogger = async (): Promise<LoggerModule["logger"]> => {
+    const { logger } = await import("../../src/utils/logger.js");
+    logger.setLevel("debug");
+    return logger;
+  };
+
+  const exitHandlers = (): (() => void)[] =>
+    processOn.mock.calls
+      .filter(([event]) => event === "exit")
+      .map(([, handler]) => handler as () => void);
+
+  beforeEach(() => {
+    writes = [];
+    vi.spyOn(process.stdout, "write").mockImplementation((chunk) => {
+      writes.push(["stdout", String(chunk)]);
+      return true;
+    });
+    vi.spyOn(process.stderr, "write").mockImplementation((chunk) => {
+      writes.push(["stderr", String(chunk)]);
+      return true;
+    });
+    // Capture the exit hook instead of registering it on the real process
+    processOn = vi.fn().mockReturnValue(process);
+    vi.spyOn(process, "on").mockImplementation(
+      processOn as unknown as typeof process.on
+    );
+
+    // Start each test with no process-wide buffer
+    delete (globalThis as Record<symbol, unknown>)[STDOUT_BUFFER];
+    vi.resetModules();
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it("should batch debug and info lines into one stdout write", async () => {
+    const logger = await loadLogger();
+
+    logger.debug("first");
+    logger.info("second", { id: 1 });
+    expect(writes).toEqual([]);
+
+    await nextTick();
+
+    expect(writes).toHaveLength(1);
+    const [stream, chunk] = writes[0] ?? [];
+    expect(stream).toBe("stdout");
+    expect(chunk).toMatch(/DEBUG: first\n.*INFO: second \{"id":1\}\n$/);
+  });
+
+  it("should skip levels below the minimum", async () => {
+    const logger = await loadLogger();
+    logger.setLevel("warn");
+
+    logger.info("hidden");
+    await nextTick();
+
+    expect(writes).toEqual([]);
+  });
+
+  it("should flush buffered lines before a warning or error", async () => {
+    const logger = await loadLogger();
+
+    logger.info("Query executed");
+    logger.error("Query failed");
+    logger.warn("Retrying");
+
+    expect(writes).toHaveLength(3);
+    expect(writes[0]?.[0]).toBe("stdout");
+    expect(writes[0]?.[1]).toContain("INFO: Query executed");
+    expect(writes[1]?.[0]).toBe("stderr");
+    expect(writes[1]?.[1]).toContain("ERROR: Query failed");
+    expect(writes[2]?.[0]).toBe("stderr");
+    expect(writes[2]?.[1]).toContain("WARN: Retrying");
+
+    // Nothing left for the scheduled flush
+    await nextTick();
+    expect(writes).toHaveLength(3);
+  });
+
+  it("should drain buffered lines on process exit", async () => {
+    const logger = await loadLogger();
+    const [onExit] = exitHandlers();
+
+    logger.info("last words");
+    onExit?.();
+
+    expect(writes).toHaveLength(1);
+    expect(writes[0]?.[1]).toContain("INFO: last words");
+  });
+
+  it("should share one buffer and exit hook across module reloads", async () => {
+    const first = await loadLogger();
+    vi.resetModules();
+    const second = await loadLogger();
+
+    expect(second).not.toBe(first);
+    expect(exitHandlers()).toHaveLength(1);
+
+    first.info("from first");
+    second.info("from second");
+    await nextTick();
+
+    expect(writes).toHaveLength(1);
+    expect(writes[0]?.[1]).toMatch(/from first\n.*from second\n$/);
+  });
+});
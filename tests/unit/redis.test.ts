@@ -0,0 +1,255 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+
+const mockClient = vi.hoisted(() => ({
+  on: vi.fn(),
+  get: vi.fn(),
+  getBuffer: vi.fn(),
+  set: vi.fn(),
+  setex: vi.fn(),
+  mget: vi.fn(),
+  mset: vi.fn(),
+  unlink: vi.fn(),
+  del: vi.fn(),
+  scan: vi.fn(),
+  pipeline: vi.fn(),
+}));
+
+vi.mock("ioredis", () => ({
+  default: function MockRedis() {
+    return mockClient;
+  },
+}));
+
+vi.mock("../../src/utils/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+  },
+}));
+
+type RedisModule = typeof import("../../src/database/redis.js");
+
+describe("Redis cache", () => {
+  let cache: RedisModule["cache"];
+
+  beforeEach(async () => {
+    vi.resetAllMocks();
+    // Fresh module per test: the client and UNLINK flag are module state
+    vi.resetModules();
+    const redis = await import("../../src/database/redis.js");
+    redis.initializeRedis("redis://localhost:6379");
+    cache = redis.cache;
+  });
+
+  describe("get", () => {
+    it("should parse JSON values", async () => {
+      mockClient.get.mockResolvedValue('{"a":1}');
+      expect(await cache.get("k")).toEqual({ a: 1 });
+    });
+
+    it("should return plain strings as-is", async () => {
+      mockClient.get.mockResolvedValue("hello world");
+      expect(await cache.get("k")).toBe("hello world");
+    });
+
+    it("should return strings that only look like JSON as-is", async () => {
+      mockClient.get.mockResolvedValue("{not json");
+      expect(await cache.get("k")).toBe("{not json");
+    });
+  });
+
+  describe("mget", () => {
+    it("should skip the round trip for no keys", async () => {
+      expect(await cache.mget([])).toEqual([]);
+      expect(mockClient.mget).not.toHaveBeenCalled();
+    });
+
+    it("should deserialize each value and keep misses as null", async () => {
+      mockClient.mget.mockResolvedValue(['{"a":1}', null, "plain"]);
+      expect(await cache.mget(["x", "y", "z"])).toEqual([
+        { a: 1 },
+        null,
+        "plain",
+      ]);
+    });
+  });
+
+  describe("mset", () => {
+    const mockPipeline = (results: [Error | null, unknown][]) => {
+      const pipeline = {
+        setex: vi.fn().mockReturnThis(),
+        exec: vi.fn().mockResolvedValue(results),
+      };
+      mockClient.pipeline.mockReturnValue(pipeline);
+      return pipeline;
+    };
+
+    it("should skip the round trip for no entries", async () => {
+      await cache.mset({}, 60);
+      expect(mockClient.mset).not.toHaveBeenCalled();
+      expect(mockClient.pipeline).not.toHaveBeenCalled();
+    });
+
+    it("should use a single MSET without a TTL", async () => {
+      await cache.mset({ a: { x: 1 }, b: "plain" });
+      expect(mockClient.mset).toHaveBeenCalledWith({
+        a: '{"x":1}',
+        b: "plain",
+      });
+      expect(mockClient.pipeline).not.toHaveBeenCalled();
+    });
+
+    it("should pipeline SETEX per key with a TTL", async () => {
+      const pipeline = mockPipeline([
+        [null, "OK"],
+        [null, "OK"],
+      ]);
+
+      await cache.mset({ a: { x: 1 }, b: "plain" }, 60);
+
+      expect(pipeline.setex).toHaveBeenCalledTimes(2);
+      expect(pipeline.setex).toHaveBeenCalledWith("a", 60, '{"x":1}');
+      expect(pipeline.setex).toHaveBeenCalledWith("b", 60, "plain");
+      expect(pipeline.exec).toHaveBeenCalledTimes(1);
+      expect(mockClient.mset).not.toHaveBeenCalled();
+    });
+
+    it("should reject when a pipelined SETEX fails", async () => {
+      mockPipeline([
+        [null, "OK"],
+        [new Error("OOM command not allowed"), null],
+      ]);
+
+      await expect(cache.mset({ a: 1, b: 2 }, 60)).rejects.toThrow(
+        "OOM command not allowed"
+      );
+    });
+  });
+
+  describe("mdelete", () => {
+    it("should skip the round trip for no keys", async () => {
+      expect(await cache.mdelete([])).toBe(0);
+      expect(mockClient.unlink).not.toHaveBeenCalled();
+      expect(mockClient.del).not.toHaveBeenCalled();
+    });
+
+    it("should delete all keys in one command", async () => {
+      mockClient.unlink.mockResolvedValue(2);
+      expect(await cache.mdelete(["a", "b"])).toBe(2);
+      expect(mockClient.unlink).toHaveBeenCalledWith("a", "b");
+    });
+  });
+
+  describe("keys", () => {
+    it("should follow the SCAN cursor until it returns to 0", async () => {
+      mockClient.scan
+        .mockResolvedValueOnce(["17", ["a", "b"]])
+        .mockResolvedValueOnce(["42", []])
+        .mockResolvedValueOnce(["0", ["c"]]);
+
+      expect(await cache.keys("user:*")).toEqual(["a", "b", "c"]);
+      expect(mockClient.scan).toHaveBeenCalledTimes(3);
+      expect(mockClient.scan).toHaveBeenNthCalledWith(
+        1,
+        "0",
+        "MATCH",
+        "user:*",
+        "COUNT",
+        expect.any(Number)
+      );
+      expect(mockClient.scan).toHaveBeenNthCalledWith(
+        2,
+        "17",
+        "MATCH",
+        "user:*",
+        "COUNT",
+        expect.any(Number)
+      );
+    });
+
+    it("should drop keys SCAN returns more than once", async () => {
+      mockClient.scan
+        .mockResolvedValueOnce(["5", ["a", "b"]])
+        .mockResolvedValueOnce(["0", ["b", "c"]]);
+
+      expect(await cache.keys("*")).toEqual(["a", "b", "c"]);
+    });
+
+    it("should yield non-empty batches from iterKeys", async () => {
+      mockClient.scan
+        .mockResolvedValueOnce(["5", []])
+        .mockResolvedValueOnce(["0", ["a"]]);
+
+      const batches: string[][] = [];
+      for await (const batch of cache.iterKeys("user:*")) {
+        batches.push(batch);
+      }
+      expect(batches).toEqual([["a"]]);
+    });
+  });
+
+  describe("delete", () => {
+    it("should delete with UNLINK", async () => {
+      mockClient.unlink.mockResolvedValue(1);
+      await cache.delete("k");
+      expect(mockClient.unlink).toHaveBeenCalledWith("k");
+      expect(mockClient.del).not.toHaveBeenCalled();
+    });
+
+    it("should fall back to DEL when UNLINK is unknown", async () => {
+      mockClient.unlink.mockRejectedValue(
+        new Error("ERR unknown command 'unlink'")
+      );
+      mockClient.del.mockResolvedValue(1);
+
+      await cache.delete("k1");
+      await cache.delete("k2");
+
+      // The fallback is remembered, so UNLINK is only tried once
+      expect(mockClient.unlink).toHaveBeenCalledTimes(1);
+      expect(mockClient.del).toHaveBeenNthCalledWith(1, "k1");
+      expect(mockClient.del).toHaveBeenNthCalledWith(2, "k2");
+    });
+
+    it("should rethrow other UNLINK errors", async () => {
+      mockClient.unlink.mockRejectedValue(new Error("Connection is closed."));
+
+      await expect(cache.delete("k")).rejects.toThrow("Connection is closed.");
+      expect(mockClient.del).not.toHaveBeenCalled();
+    });
+  });
+
+  describe("vectors", () => {
+    it("should round-trip a vector as raw float32 bytes", async () => {
+      await cache.setVector("emb", [0.5, -1.25, 3], 60);
+
+      const [key, ttl, stored] = mockClient.setex.mock.calls[0] ?? [];
+      expect(key).toBe("emb");
+      expect(ttl).toBe(60);
+      expect(Buffer.isBuffer(stored)).toBe(true);
+      expect((stored as Buffer).length).toBe(12);
+
+      // Reply Buffers can start at an odd offset inside a pooled allocation
+      const unaligned = Buffer.concat([Buffer.from([0]), stored]).subarray(1);
+      mockClient.getBuffer.mockResolvedValue(unaligned);
+
+      const vector = await cache.getVector("emb");
+      expect(vector).toBeInstanceOf(Float32Array);
+      expect(Array.from(vector ?? [])).toEqual([0.5, -1.25, 3]);
+    });
+
+    it("should return null for a missing vector", async () => {
+      mockClient.getBuffer.mockResolvedValue(null);
+      expect(await cache.getVector("emb")).toBeNull();
+    });
+
+    it("should reject values that are not float32 vectors", async () => {
+      mockClient.getBuffer.mockResolvedValue(Buffer.from("[0.5,1]"));
+      await expect(cache.getVector("emb")).rejects.toThrow(
+        /not a float32 vector/
+      );
+    });
+  });
+});
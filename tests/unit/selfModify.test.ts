@@ -0,0 +1,226 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+import { promises as fs } from "fs";
+import os from "os";
+import path from "path";
+import Redis from "ioredis";
+import {
+  SelfModifyTool,
+  PendingModification,
+} from "../../src/services/tools/self-modify.js";
+import { audit } from "../../src/security/audit.js";
+
+vi.mock("../../src/security/audit", () => ({
+  audit: vi.fn(),
+  AuditEventType: {
+    SELF_MODIFY_PROPOSE: "security.self_modify.propose",
+    SELF_MODIFY_EXECUTE: "security.self_modify.execute",
+  },
+}));
+
+vi.mock("../../src/utils/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+  },
+}));
+
+const USER = "user-1";
+const PROPOSALS_KEY = "self_modify:user:user-1:proposals";
+const context = { userId: USER };
+
+function pending(id: string, verificationCode: string): PendingModification {
+  return {
+    id,
+    userId: USER,
+    request: {
+      filePath: `notes/${id}.md`,
+      description: `Change ${id}`,
+      newContent: `content of ${id}`,
+      modifyType: "create",
+    },
+    verificationCode,
+    createdAt: new Date(),
+    expiresAt: new Date(Date.now() + 60_000),
+    status: "pending",
+  };
+}
+
+describe("SelfModifyTool", () => {
+  let tool: SelfModifyTool;
+  let mockRedis: Redis;
+  let projectRoot: string;
+  let pipeline: {
+    setex: ReturnType<typeof vi.fn>;
+    sadd: ReturnType<typeof vi.fn>;
+    expire: ReturnType<typeof vi.fn>;
+    del: ReturnType<typeof vi.fn>;
+    srem: ReturnType<typeof vi.fn>;
+    exec: ReturnType<typeof vi.fn>;
+  };
+
+  beforeEach(async () => {
+    vi.clearAllMocks();
+    projectRoot = await fs.mkdtemp(path.join(os.tmpdir(), "self-modify-"));
+    pipeline = {
+      setex: vi.fn().mockReturnThis(),
+      sadd: vi.fn().mockReturnThis(),
+      expire: vi.fn().mockReturnThis(),
+      del: vi.fn().mockReturnThis(),
+      srem: vi.fn().mockReturnThis(),
+      exec: vi.fn().mockResolvedValue([]),
+    };
+    mockRedis = {
+      get: vi.fn(),
+      setex: vi.fn(),
+      ttl: vi.fn().mockResolvedValue(600),
+      srem: vi.fn(),
+      smembers: vi.fn(),
+      mget: vi.fn(),
+      pipeline: vi.fn(() => pipeline),
+    } as unknown as Redis;
+
+    tool = new SelfModifyTool(mockRedis, projectRoot);
+  });
+
+  afterEach(async () => {
+    await fs.rm(projectRoot, { recursive: true, force: true });
+  });
+
+  describe("propose", () => {
+    const propose = () =>
+      tool.execute(
+        {
+          action: "propose",
+          filePath: "notes/todo.md",
+          description: "Add a todo list",
+          newContent: "- ship it",
+          modifyType: "create",
+        },
+        context
+      );
+
+    it("should store the proposal and index it in one pipeline", async () => {
+      const result = JSON.parse(await propose());
+      const key = `self_modify:${USER}:${result.proposalId}`;
+
+      expect(result.status).toBe("pending_verification");
+      expect(mockRedis.pipeline).toHaveBeenCalledTimes(1);
+      expect(pipeline.setex).toHaveBeenCalledWith(key, 900, expect.any(String));
+      const stored = JSON.parse(pipeline.setex.mock.calls[0]?.[2]);
+      expect(stored.verificationCode).toBe(result.verificationCode);
+      expect(pipeline.sadd).toHaveBeenCalledWith(
+        PROPOSALS_KEY,
+        result.proposalId
+      );
+      expect(pipeline.expire).toHaveBeenCalledWith(PROPOSALS_KEY, 900);
+      expect(pipeline.exec).toHaveBeenCalledTimes(1);
+    });
+
+    it("should not hand out a code when a write fails", async () => {
+      pipeline.exec.mockResolvedValue([
+        [null, "OK"],
+        [new Error("READONLY You can't write against a replica"), null],
+        [null, 1],
+      ]);
+
+      await expect(propose()).rejects.toThrow(/READONLY/);
+      expect(audit).not.toHaveBeenCalled();
+    });
+  });
+
+  describe("verify", () => {
+    it("should find the proposal by code without a proposalId", async () => {
+      const target = pending("mod_b", "654321");
+      vi.mocked(mockRedis.smembers).mockResolvedValue(["mod_a", "mod_b"]);
+      vi.mocked(mockRedis.mget).mockResolvedValue([
+        JSON.stringify(pending("mod_a", "111111")),
+        JSON.stringify(target),
+      ]);
+
+      const result = await tool.execute(
+        { action: "verify", verificationCode: "654321" },
+        context
+      );
+
+      expect(result).toContain("Successfully executed");
+      expect(mockRedis.mget).toHaveBeenCalledWith(
+        `self_modify:${USER}:mod_a`,
+        `self_modify:${USER}:mod_b`
+      );
+      // The matched index maps back to its own proposal ID
+      expect(mockRedis.setex).toHaveBeenCalledWith(
+        `self_modify:${USER}:mod_b`,
+        600,
+        expect.stringContaining('"status":"approved"')
+      );
+      expect(mockRedis.srem).toHaveBeenCalledWith(PROPOSALS_KEY, "mod_b");
+      await expect(
+        fs.readFile(path.join(projectRoot, "notes/mod_b.md"), "utf-8")
+      ).resolves.toBe("content of mod_b");
+    });
+
+    it("should skip the lookup when the user has no proposals", async () => {
+      vi.mocked(mockRedis.smembers).mockResolvedValue([]);
+
+      const result = await tool.execute(
+        { action: "verify", verificationCode: "654321" },
+        context
+      );
+
+      expect(result).toContain("No pending modification found");
+      expect(mockRedis.mget).not.toHaveBeenCalled();
+    });
+  });
+
+  describe("status", () => {
+    it("should list pending proposals with one MGET", async () => {
+      vi.mocked(mockRedis.smembers).mockResolvedValue(["mod_a", "mod_gone"]);
+      vi.mocked(mockRedis.mget).mockResolvedValue([
+        JSON.stringify(pending("mod_a", "111111")),
+        null,
+      ]);
+
+      const result = JSON.parse(
+        await tool.execute({ action: "status" }, context)
+      );
+
+      expect(mockRedis.mget).toHaveBeenCalledTimes(1);
+      expect(result.pendingModifications).toEqual([
+        expect.objectContaining({ id: "mod_a", status: "pending" }),
+      ]);
+    });
+  });
+
+  describe("cancel", () => {
+    beforeEach(() => {
+      vi.mocked(mockRedis.get).mockResolvedValue(
+        JSON.stringify(pending("mod_a", "111111"))
+      );
+    });
+
+    it("should delete and unindex the proposal in one pipeline", async () => {
+      const result = await tool.execute(
+        { action: "cancel", proposalId: "mod_a" },
+        context
+      );
+
+      expect(result).toBe('Cancelled modification proposal: "Change mod_a"');
+      expect(pipeline.del).toHaveBeenCalledWith(`self_modify:${USER}:mod_a`);
+      expect(pipeline.srem).toHaveBeenCalledWith(PROPOSALS_KEY, "mod_a");
+      expect(pipeline.exec).toHaveBeenCalledTimes(1);
+    });
+
+    it("should reject when a pipelined command fails", async () => {
+      pipeline.exec.mockResolvedValue([
+        [null, 1],
+        [new Error("LOADING Redis is loading the dataset"), null],
+      ]);
+
+      await expect(
+        tool.execute({ action: "cancel", proposalId: "mod_a" }, context)
+      ).rejects.toThrow(/LOADING/);
+    });
+  });
+});
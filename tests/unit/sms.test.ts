@@ -7,6 +7,8 @@ import {
   MessagePriority,
   MessageStatus,
   MessageDirection,
+  formatPhoneNumber,
+  chunkMessage,
 } from "../../src/types/sms.js";
 import { ValidationError, NotFoundError } from "../../src/types/index.js";
 
@@ -195,3 +197,56 @@ describe("SmsService", () => {
     });
   });
 });
+
+describe("formatPhoneNumber", () => {
+  it("should add +1 to 10-digit US numbers", () => {
+    expect(formatPhoneNumber("(555) 123-4567")).toBe("+15551234567");
+  });
+
+  it("should add + to 11-digit numbers starting with 1", () => {
+    expect(formatPhoneNumber("1-555-123-4567")).toBe("+15551234567");
+  });
+
+  it("should strip formatting from international numbers", () => {
+    expect(formatPhoneNumber("+44 20 7946 0958")).toBe("+442079460958");
+  });
+
+  it("should keep 10-digit international numbers out of the US branch", () => {
+    expect(formatPhoneNumber("+65 9123 4567")).toBe("+6591234567");
+    expect(formatPhoneNumber("+6591234567")).toBe("+6591234567");
+  });
+
+  it("should keep +1 numbers unchanged", () => {
+    expect(formatPhoneNumber("+1 (555) 123-4567")).toBe("+15551234567");
+  });
+});
+
+describe("chunkMessage", () => {
+  it("should return short messages as a single chunk", () => {
+    expect(chunkMessage("hello", 160)).toEqual(["hello"]);
+  });
+
+  it("should break at the last space that fits", () => {
+    expect(chunkMessage("hello world foo bar", 11)).toEqual([
+      "hello world",
+      "foo bar",
+    ]);
+  });
+
+  it("should keep words longer than the limit whole", () => {
+    expect(chunkMessage("hi abcdefghijkl yo", 5)).toEqual([
+      "hi",
+      "abcdefghijkl",
+      "yo",
+    ]);
+  });
+
+  it("should not emit whitespace-only chunks for leading spaces", () => {
+    expect(chunkMessage("  leading spaces here ok", 5)).toEqual([
+      "leading",
+      "spaces",
+      "here",
+      "ok",
+    ]);
+  });
+});